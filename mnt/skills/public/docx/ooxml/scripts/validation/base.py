@@ -3,6 +3,8 @@ Base validator with common validation logic for document files.
 """
 
 import re
+import tempfile
+import zipfile
 from pathlib import Path
 
 import lxml.etree
@@ -103,6 +105,10 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
+    # Parser for the structural checks: skips building the xml:id table, which
+    # nothing here uses, and lifts libxml2's size limits for very large parts
+    _PARSER = lxml.etree.XMLParser(collect_ids=False, huge_tree=True)
+
     def __init__(self, unpacked_dir, original_file, verbose=False):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
@@ -120,18 +126,34 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed roots shared by the read-only checks, cleared after validate()
+        self._tree_cache = {}
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _get_root(self, xml_file):
+        """Return the parsed root element of an XML file, parsing it only once.
+
+        The tree is shared between validators, so callers must not modify it.
+        Parse failures are not cached: validate() stops after validate_xml
+        reports one, so the later checks only ever see well-formed files.
+        """
+        root = self._tree_cache.get(xml_file)
+        if root is None:
+            root = lxml.etree.parse(str(xml_file), self._PARSER).getroot()
+            self._tree_cache[xml_file] = root
+        return root
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
             try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                # Try to parse the XML file, keeping the result for later checks
+                self._get_root(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -144,6 +166,8 @@ class BaseSchemaValidator:
                 )
 
         if errors:
+            # validate() stops here, so don't keep the roots for a later run
+            self._tree_cache.clear()
             print(f"FAILED - Found {len(errors)} XML violations:")
             for error in errors:
                 print(error)
@@ -159,7 +183,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._get_root(xml_file)
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,7 +214,8 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                # Parsed separately because mc:AlternateContent is removed below
+                root = lxml.etree.parse(str(xml_file), self._PARSER).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
                 # Remove all mc:AlternateContent elements from the tree
@@ -310,7 +335,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._get_root(rels_file)
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -319,7 +344,7 @@ class BaseSchemaValidator:
                 referenced_files = set()
                 broken_refs = []
 
-                for rel in rels_root.findall(
+                for rel in rels_root.iterfind(
                     ".//ns:Relationship",
                     namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
                 ):
@@ -390,8 +415,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -411,10 +434,10 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._get_root(rels_file)
                 rid_to_type = {}
 
-                for rel in rels_root.findall(
+                for rel in rels_root.iterfind(
                     f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
                 ):
                     rid = rel.get("Id")
@@ -434,7 +457,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._get_root(xml_file)
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -531,12 +554,12 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._get_root(content_types_file)
             declared_parts = set()
             declared_extensions = set()
 
             # Get Override declarations (specific files)
-            for override in root.findall(
+            for override in root.iterfind(
                 f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
             ):
                 part_name = override.get("PartName")
@@ -544,7 +567,7 @@ class BaseSchemaValidator:
                     declared_parts.add(part_name.lstrip("/"))
 
             # Get Default declarations (by extension)
-            for default in root.findall(
+            for default in root.iterfind(
                 f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
             ):
                 extension = default.get("Extension")
@@ -593,7 +616,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._get_root(xml_file).tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -875,9 +898,6 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
@@ -886,17 +906,16 @@ class BaseSchemaValidator:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Extract original file
+            # Extract only the corresponding file from the original
             with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+                try:
+                    zip_ref.extract(relative_path.as_posix(), temp_path)
+                except KeyError:
+                    # File didn't exist in original, so no original errors
+                    return set()
 
-            # Find corresponding file in original
             original_xml_file = temp_path / relative_path
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
             # Validate the specific file in original
             is_valid, errors = self._validate_single_file_xsd(
                 original_xml_file, temp_path
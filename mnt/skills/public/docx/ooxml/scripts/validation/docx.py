@@ -2,8 +2,6 @@
 Validator for Word document XML files against XSD schemas.
 """
 
-import re
-import tempfile
 import zipfile
 
 import lxml.etree
@@ -17,10 +15,32 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Word-specific namespace
     WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
+    # Namespace-qualified tag and attribute names
+    _W_T = f"{{{WORD_2006_NAMESPACE}}}t"
+    _W_P = f"{{{WORD_2006_NAMESPACE}}}p"
+    _XML_SPACE = f"{{{BaseSchemaValidator.XML_NAMESPACE}}}space"
+
+    # Precompiled XPath expressions, reused across every document.xml
+    _DEL_T_XPATH = lxml.etree.XPath(
+        ".//w:del//w:t", namespaces={"w": WORD_2006_NAMESPACE}
+    )
+    _INS_DELTEXT_XPATH = lxml.etree.XPath(
+        ".//w:ins//w:delText[not(ancestor::w:del)]",
+        namespaces={"w": WORD_2006_NAMESPACE},
+    )
+
     # Word-specific element to relationship type mappings
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    def __init__(self, unpacked_dir, original_file, verbose=False):
+        super().__init__(unpacked_dir, original_file, verbose)
+
+        # Only document.xml parts are subject to the Word-specific checks
+        self._document_xml_files = [
+            f for f in self.xml_files if f.name == "document.xml"
+        ]
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
@@ -67,6 +87,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
+        self._tree_cache.clear()
         return all_valid
 
     def validate_whitespace_preservation(self):
@@ -75,36 +96,29 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
+        for xml_file in self._document_xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._get_root(xml_file)
 
                 # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
+                for elem in root.iter(self._W_T):
+                    text = elem.text
+                    if not text:
+                        continue
+                    # Check if text starts or ends with whitespace
+                    if (text[0].isspace() or text[-1].isspace()) and elem.get(
+                        self._XML_SPACE
+                    ) != "preserve":
+                        # Show a preview of the text
+                        text_preview = (
+                            repr(text)[:50] + "..."
+                            if len(repr(text)) > 50
+                            else repr(text)
+                        )
+                        errors.append(
+                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                            f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                        )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
@@ -128,21 +142,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
+        for xml_file in self._document_xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._get_root(xml_file)
 
                 # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
+                for t_elem in self._DEL_T_XPATH(root):
                     if t_elem.text:
                         # Show a preview of the text
                         text_preview = (
@@ -174,16 +179,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
+        for xml_file in self._document_xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._get_root(xml_file)
                 # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                count = sum(1 for _ in root.iter(self._W_P))
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
 
@@ -194,19 +194,24 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Stream document.xml straight out of the original docx
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                with zip_ref.open("word/document.xml") as doc_xml:
+                    # Count all w:p elements, discarding each once seen
+                    paragraphs = 0
+                    for _, elem in lxml.etree.iterparse(
+                        doc_xml,
+                        events=("end",),
+                        tag=self._W_P,
+                        collect_ids=False,
+                        huge_tree=True,
+                    ):
+                        paragraphs += 1
+                        # Drop the finished paragraph and anything before it
+                        elem.clear()
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                    count = paragraphs
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -220,19 +225,12 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
+        for xml_file in self._document_xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
+                root = self._get_root(xml_file)
 
                 # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
+                invalid_elements = self._INS_DELTEXT_XPATH(root)
 
                 for elem in invalid_elements:
                     text_preview = (
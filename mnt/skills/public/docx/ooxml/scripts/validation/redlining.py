@@ -7,17 +7,36 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+INS_TAG = f"{{{W_NS}}}ins"
+DEL_TAG = f"{{{W_NS}}}del"
+AUTHOR_ATTR = f"{{{W_NS}}}author"
+T_TAG = f"{{{W_NS}}}t"
+DELTEXT_TAG = f"{{{W_NS}}}delText"
+P_TAG = f"{{{W_NS}}}p"
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
+    WORD_2006_NAMESPACE = W_NS
+
+    # Shared by both documents. Ignorable whitespace between elements is
+    # dropped; whitespace-only w:t/w:delText text is element content and kept
+    _PARSER = lxml.etree.XMLParser(
+        collect_ids=False,
+        huge_tree=True,
+        remove_blank_text=True,
+        resolve_entities=False,
+    )
+
     def __init__(self, unpacked_dir, original_docx, verbose=False):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
-        self.namespaces = {
-            "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        }
+        self.namespaces = {"w": self.WORD_2006_NAMESPACE}
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
@@ -29,29 +48,8 @@ class RedliningValidator:
 
         # First, check if there are any tracked changes by Claude to validate
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
             # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
+            if not self._has_claude_changes(modified_file):
                 if self.verbose:
                     print("PASSED - No tracked changes by Claude found.")
                 return True
@@ -60,56 +58,82 @@ class RedliningValidator:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        # Read the original document.xml straight from the docx archive
+        try:
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                original_info = zip_ref.getinfo("word/document.xml")
+
+                # A byte-identical document.xml has nothing left to validate
+                if original_info.file_size == modified_file.stat().st_size:
+                    original_bytes = zip_ref.read(original_info)
+                    if original_bytes == modified_file.read_bytes():
+                        if self.verbose:
+                            print("PASSED - document.xml is unchanged from original")
+                        return True
+                    original_root = lxml.etree.fromstring(original_bytes, self._PARSER)
+                else:
+                    with zip_ref.open(original_info) as original_file:
+                        original_root = lxml.etree.parse(
+                            original_file, self._PARSER
+                        ).getroot()
+        except KeyError:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+        except lxml.etree.XMLSyntaxError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        try:
+            modified_root = lxml.etree.parse(str(modified_file), self._PARSER).getroot()
+        except lxml.etree.XMLSyntaxError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            return False
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _has_claude_changes(self, xml_file):
+        """Check whether a document has any w:ins or w:del authored by Claude.
+
+        Streams the file and stops at the first match. Paragraphs are
+        discarded once parsed, so a document without Claude's changes is
+        scanned without ever holding the full tree in memory.
+        """
+        for event, elem in lxml.etree.iterparse(
+            str(xml_file),
+            events=("start", "end"),
+            tag=(INS_TAG, DEL_TAG, P_TAG),
+            collect_ids=False,
+            huge_tree=True,
+        ):
+            if event == "start":
+                if elem.tag != P_TAG and elem.get(AUTHOR_ATTR) == "Claude":
+                    return True
+            elif elem.tag == P_TAG:
+                # Drop the finished paragraph and anything before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+        return False
 
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
@@ -216,40 +240,40 @@ class RedliningValidator:
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
+        # Find Claude's w:ins and w:del elements, recording each one's parent
+        # and position. Indexes come from a child map built once per parent,
+        # so paragraphs with many runs are not rescanned for every change
+        changes = []
+        child_indexes = {}
+        for elem in root.iter(INS_TAG, DEL_TAG):
+            if elem.get(AUTHOR_ATTR) != "Claude":
+                continue
+            parent = elem.getparent()
+            if parent is None:
+                continue
+            index = child_indexes.get(parent)
+            if index is None:
+                index = child_indexes[parent] = {
+                    child: i for i, child in enumerate(parent)
+                }
+            changes.append((parent, index[elem], elem))
+
+        # Apply in reverse order: nested changes and later siblings are handled
+        # before anything that precedes them, so every recorded index stays valid
+        for parent, index, elem in reversed(changes):
+            if elem.tag == INS_TAG:
+                # Remove w:ins elements
                 parent.remove(elem)
+                continue
 
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
+            # Unwrap w:del: convert w:delText to w:t before moving
+            for deltext in elem.iter(DELTEXT_TAG):
+                deltext.tag = T_TAG
 
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
+            # Move all children of w:del to its parent before removing w:del
+            for child in reversed(list(elem)):
+                parent.insert(index, child)
+            parent.remove(elem)
 
     def _extract_text_content(self, root):
         """Extract text content from Word XML, preserving paragraph structure.
@@ -257,17 +281,15 @@ class RedliningValidator:
         Empty paragraphs are skipped to avoid false positives when tracked
         insertions add only structural elements without text content.
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
+        # Tag-filtered iter() does the matching in libxml2, with no path to
+        # parse. Nested paragraphs (e.g. in text boxes) contribute their text
+        # to the enclosing paragraph and also appear on their own
         paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
+        for p_elem in root.iter(P_TAG):
             # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
+            paragraph_text = "".join(
+                [t_elem.text for t_elem in p_elem.iter(T_TAG) if t_elem.text]
+            )
             # Skip empty paragraphs - they don't affect content validation
             if paragraph_text:
                 paragraphs.append(paragraph_text)
@@ -4,6 +4,8 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 
 import re
 
+import lxml.etree
+
 from .base import BaseSchemaValidator
 
 
@@ -72,12 +74,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not self.validate_no_duplicate_slide_layouts():
             all_valid = False
 
+        self._tree_cache.clear()
         return all_valid
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
         errors = []
         # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
         uuid_pattern = re.compile(
@@ -86,7 +87,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._get_root(xml_file)
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
@@ -127,8 +128,6 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
-        import lxml.etree
-
         errors = []
 
         # Find all slide master files
@@ -142,7 +141,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._get_root(slide_master)
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
@@ -155,11 +154,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._get_root(rels_file)
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
-                for rel in rels_root.findall(
+                for rel in rels_root.iterfind(
                     f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
                 ):
                     rel_type = rel.get("Type", "")
@@ -167,7 +166,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                         valid_layout_rids.add(rel.get("Id"))
 
                 # Find all sldLayoutId elements in the slide master
-                for sld_layout_id in root.findall(
+                for sld_layout_id in root.iterfind(
                     f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"
                 ):
                     r_id = sld_layout_id.get(
@@ -202,27 +201,25 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
         slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._get_root(rels_file)
 
-                # Find all slideLayout relationships
-                layout_rels = [
-                    rel
-                    for rel in root.findall(
+                # Count all slideLayout relationships
+                layout_rel_count = sum(
+                    1
+                    for rel in root.iterfind(
                         f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
                     )
                     if "slideLayout" in rel.get("Type", "")
-                ]
+                )
 
-                if len(layout_rels) > 1:
+                if layout_rel_count > 1:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {layout_rel_count} slideLayout references"
                     )
 
             except Exception as e:
@@ -242,8 +239,6 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
@@ -258,10 +253,10 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._get_root(rels_file)
 
                 # Find all notesSlide relationships
-                for rel in root.findall(
+                for rel in root.iterfind(
                     f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
                 ):
                     rel_type = rel.get("Type", "")
@@ -5,7 +5,7 @@ Extract structured text content from PowerPoint presentations.
 This module provides functionality to:
 - Extract all text content from PowerPoint shapes
 - Preserve paragraph formatting (alignment, bullets, fonts, spacing)
-- Handle nested GroupShapes recursively with correct absolute positions
+- Handle nested GroupShapes with correct absolute positions
 - Sort shapes by visual position on slides
 - Filter out slide numbers and non-content placeholders
 - Export to JSON with clean, structured data
@@ -35,6 +35,12 @@ from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
 
+# orjson is optional; it serializes large inventories much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
 ParagraphDict = Dict[str, JsonValue]
@@ -46,6 +52,15 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+_EMU_PER_INCH = 914400.0  # English Metric Units per inch
+
+# Paragraph alignments reported in the inventory (LEFT is the default)
+_ALIGNMENT_MAP = {
+    PP_ALIGN.CENTER: "CENTER",
+    PP_ALIGN.RIGHT: "RIGHT",
+    PP_ALIGN.JUSTIFY: "JUSTIFY",
+}
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -137,13 +152,31 @@ class ShapeWithPosition:
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
-    def __init__(self, paragraph: Any):
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
+
+    def __init__(self, paragraph: Any, text: Optional[str] = None):
         """Initialize from a PowerPoint paragraph object.
 
         Args:
             paragraph: The PowerPoint paragraph object
+            text: The paragraph's stripped text, if the caller already has it
         """
-        self.text: str = paragraph.text.strip()
+        self.text: str = text if text is not None else paragraph.text.strip()
         self.bullet: bool = False
         self.level: Optional[int] = None
         self.alignment: Optional[str] = None
@@ -159,74 +192,70 @@ class ParagraphData:
         self.line_spacing: Optional[float] = None
 
         # Check for bullet formatting
-        if (
-            hasattr(paragraph, "_p")
-            and paragraph._p is not None
-            and paragraph._p.pPr is not None
-        ):
-            pPr = paragraph._p.pPr
+        p_elem = getattr(paragraph, "_p", None)
+        pPr = p_elem.pPr if p_elem is not None else None
+        if pPr is not None:
             ns = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
             if (
                 pPr.find(f"{ns}buChar") is not None
                 or pPr.find(f"{ns}buAutoNum") is not None
             ):
                 self.bullet = True
-                if hasattr(paragraph, "level"):
-                    self.level = paragraph.level
+                self.level = getattr(paragraph, "level", None)
 
         # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
-            alignment_map = {
-                PP_ALIGN.CENTER: "CENTER",
-                PP_ALIGN.RIGHT: "RIGHT",
-                PP_ALIGN.JUSTIFY: "JUSTIFY",
-            }
-            if paragraph.alignment in alignment_map:
-                self.alignment = alignment_map[paragraph.alignment]
+        alignment = getattr(paragraph, "alignment", None)
+        if alignment is not None:
+            self.alignment = _ALIGNMENT_MAP.get(alignment)
 
         # Add spacing properties if set
-        if hasattr(paragraph, "space_before") and paragraph.space_before:
-            self.space_before = paragraph.space_before.pt
-        if hasattr(paragraph, "space_after") and paragraph.space_after:
-            self.space_after = paragraph.space_after.pt
+        space_before = getattr(paragraph, "space_before", None)
+        if space_before:
+            self.space_before = space_before.pt
+        space_after = getattr(paragraph, "space_after", None)
+        if space_after:
+            self.space_after = space_after.pt
 
         # Extract font properties from first run
-        if paragraph.runs:
-            first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
-                if font.name:
-                    self.font_name = font.name
-                if font.size:
-                    self.font_size = font.size.pt
-                if font.bold is not None:
-                    self.bold = font.bold
-                if font.italic is not None:
-                    self.italic = font.italic
-                if font.underline is not None:
-                    self.underline = font.underline
-
-                # Handle color - both RGB and theme colors
+        runs = paragraph.runs
+        font = getattr(runs[0], "font", None) if runs else None
+        if font is not None:
+            if font.name:
+                self.font_name = font.name
+            font_size = font.size
+            if font_size:
+                self.font_size = font_size.pt
+            if font.bold is not None:
+                self.bold = font.bold
+            if font.italic is not None:
+                self.italic = font.italic
+            if font.underline is not None:
+                self.underline = font.underline
+
+            # Handle color - both RGB and theme colors
+            color = font.color
+            try:
+                # Try RGB color first
+                if color.rgb:
+                    self.color = str(color.rgb)
+            except (AttributeError, TypeError):
+                # Fall back to theme color
                 try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
+                    if color.theme_color:
+                        self.theme_color = color.theme_color.name
                 except (AttributeError, TypeError):
-                    # Fall back to theme color
-                    try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
-                    except (AttributeError, TypeError):
-                        pass
+                    pass
 
         # Add line spacing if set
-        if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
-            if hasattr(paragraph.line_spacing, "pt"):
-                self.line_spacing = round(paragraph.line_spacing.pt, 2)
+        line_spacing = getattr(paragraph, "line_spacing", None)
+        if line_spacing is not None:
+            line_spacing_pt = getattr(line_spacing, "pt", None)
+            if line_spacing_pt is not None:
+                self.line_spacing = round(line_spacing_pt, 2)
             else:
                 # Multiplier - convert to points
                 font_size = self.font_size if self.font_size else 12.0
-                self.line_spacing = round(paragraph.line_spacing * font_size, 2)
+                self.line_spacing = round(line_spacing * font_size, 2)
 
     def to_dict(self) -> ParagraphDict:
         """Convert to dictionary for JSON serialization, excluding None values."""
@@ -266,10 +295,33 @@ class ParagraphData:
 class ShapeData:
     """Data structure for shape properties extracted from a PowerPoint shape."""
 
+    __slots__ = (
+        "shape",
+        "shape_id",
+        "slide_width_emu",
+        "slide_height_emu",
+        "placeholder_type",
+        "default_font_size",
+        "left",
+        "top",
+        "width",
+        "height",
+        "left_emu",
+        "top_emu",
+        "width_emu",
+        "height_emu",
+        "frame_overflow_bottom",
+        "slide_overflow_right",
+        "slide_overflow_bottom",
+        "overlapping_shapes",
+        "warnings",
+        "_paragraphs",
+    )
+
     @staticmethod
     def emu_to_inches(emu: int) -> float:
         """Convert EMUs (English Metric Units) to inches."""
-        return emu / 914400.0
+        return emu / _EMU_PER_INCH
 
     @staticmethod
     def inches_to_pixels(inches: float, dpi: int = 96) -> int:
@@ -402,6 +454,7 @@ class ShapeData:
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self._paragraphs: Optional[List[ParagraphData]] = None  # Set on first access
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
@@ -436,22 +489,19 @@ class ShapeData:
             else (shape.top if hasattr(shape, "top") else 0)
         )
 
-        self.left: float = round(self.emu_to_inches(left_emu), 2)  # type: ignore
-        self.top: float = round(self.emu_to_inches(top_emu), 2)  # type: ignore
-        self.width: float = round(
-            self.emu_to_inches(shape.width if hasattr(shape, "width") else 0),
-            2,  # type: ignore
-        )
-        self.height: float = round(
-            self.emu_to_inches(shape.height if hasattr(shape, "height") else 0),
-            2,  # type: ignore
-        )
+        width_emu = shape.width if hasattr(shape, "width") else 0
+        height_emu = shape.height if hasattr(shape, "height") else 0
+
+        self.left: float = round(left_emu / _EMU_PER_INCH, 2)  # type: ignore
+        self.top: float = round(top_emu / _EMU_PER_INCH, 2)  # type: ignore
+        self.width: float = round(width_emu / _EMU_PER_INCH, 2)  # type: ignore
+        self.height: float = round(height_emu / _EMU_PER_INCH, 2)  # type: ignore
 
         # Store EMU positions for overflow calculations
         self.left_emu = left_emu
         self.top_emu = top_emu
-        self.width_emu = shape.width if hasattr(shape, "width") else 0
-        self.height_emu = shape.height if hasattr(shape, "height") else 0
+        self.width_emu = width_emu
+        self.height_emu = height_emu
 
         # Calculate overflow status
         self.frame_overflow_bottom: Optional[float] = None
@@ -467,15 +517,15 @@ class ShapeData:
 
     @property
     def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return []
-
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
+        """Paragraphs from the shape's text frame, computed on first access."""
+        if self._paragraphs is None:
+            self._paragraphs = []
+            if self.shape and hasattr(self.shape, "text_frame"):
+                for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
+                    text = paragraph.text.strip()
+                    if text:
+                        self._paragraphs.append(ParagraphData(paragraph, text))
+        return self._paragraphs
 
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
@@ -583,11 +633,18 @@ class ShapeData:
         # Calculate total height of all paragraphs
         total_height_px = 0
 
+        # Keep the extracted paragraphs so self.paragraphs doesn't redo the work
+        paragraphs = []
+
         for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
+            # paragraph.text joins all runs, so read it only once
+            raw_text = paragraph.text
+            text = raw_text.strip()
+            if not text:
                 continue
 
-            para_data = ParagraphData(paragraph)
+            para_data = ParagraphData(paragraph, text)
+            paragraphs.append(para_data)
 
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
@@ -605,7 +662,7 @@ class ShapeData:
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
+            for line in raw_text.split("\n"):
                 wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
                 all_wrapped_lines.extend(wrapped)
 
@@ -629,6 +686,8 @@ class ShapeData:
                 if para_data.space_after:
                     total_height_px += para_data.space_after * 96 / 72
 
+        self._paragraphs = paragraphs
+
         # Check for overflow (ignore negligible overflows <= 0.05")
         if total_height_px > usable_height_px:
             overflow_px = total_height_px - usable_height_px
@@ -659,20 +718,14 @@ class ShapeData:
 
     def _detect_bullet_issues(self) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
-
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        # Reuse the extracted (stripped, non-empty) paragraph text
+        for para_data in self.paragraphs:
+            text = para_data.text
             # Check for manual bullet symbols
-            if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
+            if any(text.startswith(symbol + " ") for symbol in bullet_symbols):
                 self.warnings.append(
                     "manual_bullet_symbol: use proper bullet formatting"
                 )
@@ -766,11 +819,12 @@ def is_valid_shape(shape: BaseShape) -> bool:
 def collect_shapes_with_absolute_positions(
     shape: BaseShape, parent_left: int = 0, parent_top: int = 0
 ) -> List[ShapeWithPosition]:
-    """Recursively collect all shapes with valid text, calculating absolute positions.
+    """Collect all shapes with valid text, calculating absolute positions.
 
     For shapes within groups, their positions are relative to the group.
     This function calculates the absolute position on the slide by accumulating
-    parent group offsets.
+    parent group offsets. Nested groups are walked with an explicit stack
+    rather than recursion, so deep nesting cannot hit the recursion limit.
 
     Args:
         shape: The shape to process
@@ -780,40 +834,44 @@ def collect_shapes_with_absolute_positions(
     Returns:
         List of ShapeWithPosition objects with absolute positions
     """
-    if hasattr(shape, "shapes"):  # GroupShape
-        result = []
-        # Get this group's position
-        group_left = shape.left if hasattr(shape, "left") else 0
-        group_top = shape.top if hasattr(shape, "top") else 0
-
-        # Calculate absolute position for this group
-        abs_group_left = parent_left + group_left
-        abs_group_top = parent_top + group_top
-
-        # Process children with accumulated offsets
-        for child in shape.shapes:  # type: ignore
-            result.extend(
-                collect_shapes_with_absolute_positions(
-                    child, abs_group_left, abs_group_top
-                )
+    result = []
+    stack = [(shape, parent_left, parent_top)]
+
+    while stack:
+        shape, parent_left, parent_top = stack.pop()
+
+        if hasattr(shape, "shapes"):  # GroupShape
+            # Get this group's position
+            group_left = shape.left if hasattr(shape, "left") else 0
+            group_top = shape.top if hasattr(shape, "top") else 0
+
+            # Calculate absolute position for this group
+            abs_group_left = parent_left + group_left
+            abs_group_top = parent_top + group_top
+
+            # Queue children with accumulated offsets, reversed so they are
+            # popped in document order
+            children = list(shape.shapes)  # type: ignore
+            stack.extend(
+                (child, abs_group_left, abs_group_top) for child in reversed(children)
             )
-        return result
+            continue
 
-    # Regular shape - check if it has valid text
-    if is_valid_shape(shape):
-        # Calculate absolute position
-        shape_left = shape.left if hasattr(shape, "left") else 0
-        shape_top = shape.top if hasattr(shape, "top") else 0
-
-        return [
-            ShapeWithPosition(
-                shape=shape,
-                absolute_left=parent_left + shape_left,
-                absolute_top=parent_top + shape_top,
+        # Regular shape - check if it has valid text
+        if is_valid_shape(shape):
+            # Calculate absolute position
+            shape_left = shape.left if hasattr(shape, "left") else 0
+            shape_top = shape.top if hasattr(shape, "top") else 0
+
+            result.append(
+                ShapeWithPosition(
+                    shape=shape,
+                    absolute_left=parent_left + shape_left,
+                    absolute_top=parent_top + shape_top,
+                )
             )
-        ]
 
-    return []
+    return result
 
 
 def sort_shapes_by_position(shapes: List[ShapeData]) -> List[ShapeData]:
@@ -827,22 +885,21 @@ def sort_shapes_by_position(shapes: List[ShapeData]) -> List[ShapeData]:
     # Sort by top position first
     shapes = sorted(shapes, key=lambda s: (s.top, s.left))
 
-    # Group shapes by row (within 0.5 inches vertically)
+    # Group shapes by row (within 0.5 inches of the row's first shape). With
+    # the list sorted by top, each row is a contiguous slice of it
     result = []
-    row = [shapes[0]]
+    row_start = 0
     row_top = shapes[0].top
 
-    for shape in shapes[1:]:
-        if abs(shape.top - row_top) <= 0.5:
-            row.append(shape)
-        else:
+    for idx, shape in enumerate(shapes):
+        if shape.top - row_top > 0.5:
             # Sort current row by left position and add to result
-            result.extend(sorted(row, key=lambda s: s.left))
-            row = [shape]
+            result.extend(sorted(shapes[row_start:idx], key=lambda s: s.left))
+            row_start = idx
             row_top = shape.top
 
     # Don't forget the last row
-    result.extend(sorted(row, key=lambda s: s.left))
+    result.extend(sorted(shapes[row_start:], key=lambda s: s.left))
     return result
 
 
@@ -974,6 +1031,16 @@ def extract_text_inventory(
     return inventory
 
 
+def _inventory_to_dict(inventory: InventoryData) -> InventoryDict:
+    """Convert an inventory of ShapeData objects to JSON-serializable dictionaries."""
+    return {
+        slide_key: {
+            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
+        }
+        for slide_key, shapes in inventory.items()
+    }
+
+
 def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
@@ -989,15 +1056,7 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
         Nested dictionary with all data serialized for JSON
     """
     inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
-
-    # Convert ShapeData objects to dictionaries
-    dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        dict_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
-
-    return dict_inventory
+    return _inventory_to_dict(inventory)
 
 
 def save_inventory(inventory: InventoryData, output_path: Path) -> None:
@@ -1005,12 +1064,13 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
 
     Converts ShapeData objects to dictionaries for JSON serialization.
     """
-    # Convert ShapeData objects to dictionaries
-    json_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    json_inventory = _inventory_to_dict(inventory)
+
+    if orjson is not None:
+        # Same layout as the json fallback below (2-space indent, UTF-8 text)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(json_inventory, option=orjson.OPT_INDENT_2))
+        return
 
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)